@@ -1,6 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import pandas as pd
+import numpy as np
 import os
 import threading
 import queue
@@ -16,6 +17,12 @@ class DataFilterApp:
         self.file_path = ""
         self.data_queue = queue.Queue()
         self.export_queue = queue.Queue()
+        self.summary_queue = queue.Queue()
+        self.summary_token = 0 # Incremented per request so stale summaries can be dropped
+        self.summary_pending = None # Token of the summary still being computed, if any
+        self.summary_polling = False
+        self.summary_actions = {} # Treeview item id -> (operator, value) for the advanced filter
+        self.summary_column = None
 
         # --- Main Layout ---
         main_frame = ttk.Frame(self.root, padding="10")
@@ -53,11 +60,18 @@ class DataFilterApp:
         self.right_pane = ttk.LabelFrame(paned_window, text="数据预览")
         paned_window.add(self.right_pane, weight=2)
 
+        preview_mode_frame = ttk.Frame(self.right_pane)
+        preview_mode_frame.pack(side=tk.TOP, fill=tk.X)
+        self.summary_mode = tk.BooleanVar(value=True)
+        ttk.Radiobutton(preview_mode_frame, text="摘要 (单击填入筛选条件)", variable=self.summary_mode, value=True, command=self.update_data_preview).pack(side=tk.LEFT, padx=5)
+        ttk.Radiobutton(preview_mode_frame, text="全部行", variable=self.summary_mode, value=False, command=self.update_data_preview).pack(side=tk.LEFT, padx=5)
+
         self.data_preview_tree = ttk.Treeview(self.right_pane, columns=('Index', 'Value'), show='headings')
         self.data_preview_tree.heading('Index', text='行号')
         self.data_preview_tree.heading('Value', text='值')
         self.data_preview_tree.column('Index', width=80, anchor='center')
         self.data_preview_tree.column('Value', width=300)
+        self.data_preview_tree.bind('<ButtonRelease-1>', self.on_summary_row_clicked)
 
         tree_scrollbar = ttk.Scrollbar(self.right_pane, orient=tk.VERTICAL, command=self.data_preview_tree.yview)
         self.data_preview_tree.config(yscrollcommand=tree_scrollbar.set)
@@ -194,6 +208,7 @@ class DataFilterApp:
     def populate_column_listbox(self):
         """Clears and fills the column listbox with columns from the dataframe."""
         self.column_listbox.delete(0, tk.END) # Clear existing items
+        self.invalidate_summary()
         self.data_preview_tree.delete(*self.data_preview_tree.get_children()) # Clear preview
         if self.df is not None:
             for col in self.df.columns:
@@ -214,8 +229,9 @@ class DataFilterApp:
         
         initial_count = len(self.df)
         
-        # Use dropna on the subset of selected columns
-        self.df.dropna(subset=selected_columns, inplace=True)
+        # Use dropna on the subset of selected columns. Not inplace, so a summary
+        # still being computed in the background keeps reading the old rows.
+        self.df = self.df.dropna(subset=selected_columns)
         
         final_count = len(self.df)
         removed_count = initial_count - final_count
@@ -303,6 +319,8 @@ class DataFilterApp:
 
     def update_data_preview(self, event=None):
         """Updates the treeview with data from the selected column."""
+        self.invalidate_summary() # The data or the selection changed, so any running summary is stale
+
         if not self.column_listbox.curselection():
             return
             
@@ -324,7 +342,14 @@ class DataFilterApp:
         self.right_pane.config(text=f"预览: {selected_col} - 类型: {col_dtype}")
         # ----------------------------------------------------------------
 
+        if self.summary_mode.get():
+            self.start_summary_thread(selected_col)
+            return
+
         # Display all rows
+        self.data_preview_tree.heading('Index', text='行号')
+        self.data_preview_tree.heading('Value', text='值')
+        self.data_preview_tree.column('Index', width=80)
         preview_df = self.df[[selected_col]]
         
         for index, row in preview_df.iterrows():
@@ -335,6 +360,156 @@ class DataFilterApp:
                 display_value = str(value)
             self.data_preview_tree.insert("", "end", values=(index, display_value))
 
+    def invalidate_summary(self):
+        """Drops the current summary and any still being computed, so its rows can no longer fill the filter."""
+        self.summary_token += 1
+        self.summary_pending = None
+        self.summary_actions = {}
+        self.summary_column = None
+
+    def start_summary_thread(self, col):
+        """Computes the summary of a column in a background thread and shows it when ready."""
+        self.data_preview_tree.heading('Index', text='项目')
+        self.data_preview_tree.heading('Value', text='统计')
+        self.data_preview_tree.column('Index', width=140)
+        self.data_preview_tree.insert("", "end", values=("", "正在计算摘要..."))
+
+        thread = threading.Thread(target=self.summary_worker, args=(self.summary_token, col, self.df[col]))
+        thread.daemon = True
+        thread.start()
+
+        self.summary_pending = self.summary_token
+        if not self.summary_polling:
+            self.summary_polling = True
+            self.root.after(100, self.check_summary_queue)
+
+    def summary_worker(self, token, col, series):
+        """Worker function that computes the column summary."""
+        try:
+            self.summary_queue.put(("success", token, (col, self.compute_column_summary(series))))
+        except Exception as e:
+            self.summary_queue.put(("error", token, (col, str(e))))
+
+    def compute_column_summary(self, series, bins=20, top_k=15):
+        """Returns null rate plus histogram and quantiles (numeric) or top-k frequencies (other types)."""
+        total = len(series)
+        summary = {'total': total}
+
+        if pd.api.types.is_numeric_dtype(series.dtype):
+            values = series.to_numpy(dtype='float64', na_value=np.nan)
+            nulls = int(np.isnan(values).sum())
+            finite = values[np.isfinite(values)]
+            summary['kind'] = 'numeric'
+            summary['nulls'] = nulls
+            summary['infinite'] = total - nulls - len(finite) # ±inf, excluded from the statistics below
+            if len(finite):
+                quantile_points = np.array([0, 0.05, 0.25, 0.5, 0.75, 0.95, 1])
+                summary['mean'] = float(finite.mean())
+                # Sample std (ddof=1), matching pandas and Stata; undefined for a single value
+                summary['std'] = float(finite.std(ddof=1)) if len(finite) > 1 else np.nan
+                summary['quantiles'] = list(zip(quantile_points, np.quantile(finite, quantile_points)))
+                counts, edges = np.histogram(finite, bins=bins)
+                summary['histogram'] = list(zip(counts, edges[:-1], edges[1:]))
+            return summary
+
+        # Factorize once, then count every category with a single bincount
+        codes, uniques = pd.factorize(series)
+        present = codes[codes >= 0]
+        counts = np.bincount(present, minlength=len(uniques))
+        order = np.argsort(-counts, kind='stable')[:top_k]
+        summary['kind'] = 'categorical'
+        summary['nulls'] = total - len(present)
+        summary['distinct'] = len(uniques)
+        summary['top'] = [(uniques[i], int(counts[i])) for i in order]
+        return summary
+
+    def check_summary_queue(self):
+        """Checks the queue for summaries and renders the one matching the current preview."""
+        latest = None
+        try:
+            while True:
+                result = self.summary_queue.get_nowait()
+                if self.summary_pending is not None and result[1] == self.summary_pending:
+                    latest = result
+        except queue.Empty:
+            pass
+
+        if latest is None:
+            if self.summary_pending is None or not self.summary_mode.get():
+                # Nothing outstanding (the view changed or switched to all rows), stop polling
+                self.summary_polling = False
+                return
+            # The current summary is not ready yet (older results are simply discarded)
+            self.root.after(100, self.check_summary_queue)
+            return
+
+        self.summary_polling = False
+        self.summary_pending = None
+        status, _, (col, data) = latest
+        self.data_preview_tree.delete(*self.data_preview_tree.get_children())
+        if status == "error":
+            self.data_preview_tree.insert("", "end", values=("错误", data))
+            return
+        self.render_column_summary(col, data)
+
+    def render_column_summary(self, col, summary):
+        """Fills the preview treeview with a computed summary; clickable rows are recorded in summary_actions."""
+        tree = self.data_preview_tree
+        self.summary_column = col
+        total = summary['total']
+        null_rate = summary['nulls'] / total if total else 0
+        tree.insert("", "end", values=("记录数", total))
+        tree.insert("", "end", values=("空值", f"{summary['nulls']} ({null_rate:.2%})"))
+
+        if summary['kind'] == 'numeric':
+            infinite_rate = summary['infinite'] / total if total else 0
+            tree.insert("", "end", values=("无穷值 (±inf)", f"{summary['infinite']} ({infinite_rate:.2%})"))
+            if 'quantiles' not in summary:
+                return
+            tree.insert("", "end", values=("均值 / 标准差", f"{summary['mean']:.6g} / {summary['std']:.6g}"))
+            tree.insert("", "end", values=("--- 分位数 ---", ""))
+            for point, value in summary['quantiles']:
+                item = tree.insert("", "end", values=(f"P{point * 100:g}", f"{value:.6g}"))
+                self.summary_actions[item] = ('>=', self.format_filter_value(value))
+
+            tree.insert("", "end", values=("--- 直方图 ---", ""))
+            max_count = max(count for count, _, _ in summary['histogram'])
+            last_bin = len(summary['histogram']) - 1
+            for i, (count, lower, upper) in enumerate(summary['histogram']):
+                bar = "█" * int(round(20 * count / max_count)) if max_count else ""
+                # np.histogram closes the last bin on both ends, so it includes the maximum
+                closing = "]" if i == last_bin else ")"
+                item = tree.insert("", "end", values=(f"[{lower:.4g}, {upper:.4g}{closing}", f"{bar} {count}"))
+                self.summary_actions[item] = ('>=', self.format_filter_value(lower))
+        else:
+            tree.insert("", "end", values=("不同值", summary['distinct']))
+            tree.insert("", "end", values=(f"--- 前 {len(summary['top'])} 频数 ---", ""))
+            for value, count in summary['top']:
+                share = count / total if total else 0
+                item = tree.insert("", "end", values=(str(value), f"{count} ({share:.2%})"))
+                self.summary_actions[item] = ('==', str(value))
+
+    def format_filter_value(self, value):
+        """Formats a number exactly, without a trailing '.0', for the advanced filter value box."""
+        return np.format_float_positional(value, trim='-')
+
+    def on_summary_row_clicked(self, event):
+        """Fills the advanced filter operator and value from the clicked summary row."""
+        item = self.data_preview_tree.identify_row(event.y)
+        if item not in self.summary_actions:
+            return
+        if self.df is None or self.summary_column not in self.df.columns:
+            return
+        op, value = self.summary_actions[item]
+
+        if self.adv_filter_col.get() != self.summary_column:
+            self.adv_filter_col.set(self.summary_column)
+            self.on_adv_col_selected()
+
+        self.adv_filter_op.set(op)
+        self.adv_filter_val.delete(0, tk.END)
+        self.adv_filter_val.insert(0, value)
+
     def reset_data(self):
         """Resets the dataframe to its original state after loading."""
         if self.original_df is None: